@@ -2,20 +2,126 @@
 """Python 3 API wrapper for Garmin Connect to get your statistics."""
 import json
 import logging
-import re
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import LoadError, LWPCookieJar
+from time import monotonic
+from types import MappingProxyType
 from typing import Any, Dict
+from urllib.parse import quote
+
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    def _loads(data):
+        """Parse JSON from str or bytes with orjson."""
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _loads(data):
+        """Parse JSON from str or bytes with the stdlib."""
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
 
-import cloudscraper
 
 logger = logging.getLogger(__file__)
 
+_CSRF_ANCHOR = b'name="_csrf" value="'
+_TICKET_ANCHOR = b"?ticket="
+_TICKET_CHARS = frozenset(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+)
+
+
+def _scan_csrf(content):
+    """Extract the CSRF token from the SSO page with a bounded scan."""
+    start = content.find(_CSRF_ANCHOR)
+    if start < 0:
+        return None
+    start += len(_CSRF_ANCHOR)
+    end = content.find(b'"', start)
+    if end < 0:
+        return None
+    return content[start:end].decode("ascii")
+
+
+def _scan_ticket(content):
+    """Extract the SSO service ticket with a bounded scan."""
+    start = content.find(_TICKET_ANCHOR)
+    if start < 0:
+        return None
+    start += len(_TICKET_ANCHOR)
+    end = start
+    length = len(content)
+    while end < length and content[end] in _TICKET_CHARS:
+        end += 1
+    return content[start:end].decode("ascii")
+
+
+# Only retry gateway-style failures inside urllib3. 429 and 500 must reach
+# ApiClient._request so they map to the package exceptions and feed the
+# client-side backoff; with them in the forcelist urllib3 would sleep for
+# the whole Retry-After window and raise RetryError instead.
+_RETRY_KWARGS = {
+    "total": 3,
+    "backoff_factor": 1.0,
+    "status_forcelist": (502, 503, 504),
+    "allowed_methods": frozenset(("GET", "POST")),
+    "respect_retry_after_header": True,
+}
+try:
+    _RETRY = Retry(backoff_jitter=0.5, **_RETRY_KWARGS)
+except TypeError:  # urllib3 < 2 has no backoff_jitter
+    _RETRY = Retry(**_RETRY_KWARGS)
+
+_SSO_LOGIN_PARAMS = {
+    "locale": "en_US",
+    "id": "gauth-widget",
+    "privacyStatementUrl": "//connect.garmin.com/en-US/privacy/",
+    "clientId": "GarminConnect",
+    "rememberMeShown": "true",
+    "rememberMeChecked": "false",
+    "createAccountShown": "true",
+    "openCreateAccount": "false",
+    "displayNameShown": "false",
+    "consumeServiceTicket": "false",
+    "initialFocus": "true",
+    "embedWidget": "false",
+    "generateExtraServiceTicket": "true",
+    "generateTwoExtraServiceTickets": "false",
+    "generateNoServiceTicket": "false",
+    "globalOptInShown": "true",
+    "globalOptInChecked": "false",
+    "mobile": "false",
+    "connectLegalTerms": "true",
+    "locationPromptShown": "true",
+    "showPassword": "true",
+}
+
 
 class ApiClient:
     """Class for a single API endpoint."""
 
-    default_headers = {
-        'User-Agent'    : 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.14; rv:66.0) Gecko/20100101 Firefox/66.0'
-    }
+    __slots__ = (
+        "session",
+        "baseurl",
+        "headers",
+        "_base",
+        "_base_slash",
+        "_blocked_until",
+        "_backoff",
+    )
+
+    default_headers = MappingProxyType({
+        'User-Agent'    : 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.14; rv:66.0) Gecko/20100101 Firefox/66.0',
+        'Accept-Encoding': 'gzip, deflate',
+    })
 
     def __init__(
         self,
@@ -27,89 +133,100 @@ class ApiClient:
         """Return a new Client instance."""
         self.session = session
         self.baseurl = baseurl
-        if headers:
-            self.headers = headers
-        else:
-            self.headers = self.default_headers.copy()
-        self.headers.update(aditional_headers)
+        self._base = "https://" + baseurl
+        self._base_slash = self._base + "/"
+        self._blocked_until = 0.0
+        self._backoff = 1.0
+        self.headers = dict(headers or self.default_headers)
+        if aditional_headers:
+            self.headers.update(aditional_headers)
 
     def url(self, addurl=None):
         """Return the url for the API endpoint."""
 
-        path = f"https://{self.baseurl}"
         if addurl is not None:
-            path += f"/{addurl}"
+            return self._base_slash + addurl
 
-        return path
+        return self._base
 
-    def get(self, addurl, aditional_headers=None, params=None):
-        """Make an API call using the GET method."""
-        total_headers = self.headers.copy()
+    def _request(self, method, addurl, aditional_headers=None, params=None, data=None):
+        """Issue a request and translate HTTP errors to package exceptions."""
         if aditional_headers:
-            total_headers.update(aditional_headers)
+            total_headers = {**self.headers, **aditional_headers}
+        else:
+            total_headers = self.headers
         url = self.url(addurl)
+        if monotonic() < self._blocked_until:
+            raise GarminConnectTooManyRequestsError("Too many requests")
+        response = None
         try:
-            response = self.session.get(url, headers=total_headers, params=params)
+            response = self.session.request(
+                method, url, headers=total_headers, params=params, data=data
+            )
             response.raise_for_status()
+            self._backoff = 1.0
             return response
         except Exception as err:
+            if response is None:
+                # The request itself failed (connection error, timeout,
+                # retries exhausted); there is no status code to map.
+                raise GarminConnectConnectionError(
+                    f"Connection error - {err}"
+                ) from err
             if response.status_code == 429:
-                raise GarminConnectTooManyRequestsError("Too many requests") from err
-            if response.status_code == 401:
-                raise GarminConnectAuthenticationError("Authentication error") from err
-            if response.status_code == 403:
-                raise GarminConnectConnectionError("Forbidden url") from err
-            if response.status_code == 500:
-                raise GarminConnectConnectionError("Server error") from err
-            if response.status_code == 404:
-                raise GarminConnectConnectionError("Not found") from err
+                try:
+                    delay = float(response.headers.get("Retry-After"))
+                except (TypeError, ValueError):
+                    self._backoff = min(3600.0, self._backoff * 2)
+                    delay = self._backoff + random.uniform(0, self._backoff)
+                self._blocked_until = monotonic() + delay
+            known = _STATUS_EXCEPTIONS.get(response.status_code)
+            if known:
+                raise known[0](known[1]) from err
             try:
-                resp = response.json()
-                error = resp["message"].json()
-            except AttributeError:
+                error = response.json()["message"]
+            except Exception:  # pylint: disable=broad-except
                 error = "Unknown"
 
             raise GarminConnectConnectionError(
                 f"Unknown error {response.status_code} - {error}"
             ) from err
 
+    def get(self, addurl, aditional_headers=None, params=None):
+        """Make an API call using the GET method."""
+        return self._request(
+            "GET", addurl, aditional_headers=aditional_headers, params=params
+        )
+
     def post(self, addurl, aditional_headers, params, data):
         """Make an API call using the POST method."""
-        total_headers = self.headers.copy()
-        if aditional_headers:
-            total_headers.update(aditional_headers)
-        url = self.url(addurl)
-        try:
-            response = self.session.post(
-                url, headers=total_headers, params=params, data=data
-            )
-            response.raise_for_status()
-            return response
-        except Exception as err:
-            if response.status_code == 429:
-                raise GarminConnectTooManyRequestsError("Too many requests") from err
-            if response.status_code == 401:
-                raise GarminConnectAuthenticationError("Authentication error") from err
-            if response.status_code == 403:
-                raise GarminConnectConnectionError("Forbidden url") from err
-            if response.status_code == 500:
-                raise GarminConnectConnectionError("Server error") from err
-            if response.status_code == 404:
-                raise GarminConnectConnectionError("Not found") from err
-            try:
-                resp = response.json()
-                error = resp["message"].json()
-            except AttributeError:
-                error = "Unknown"
-
-            raise GarminConnectConnectionError(
-                f"Unknown error {response.status_code} - {error}"
-            ) from err
+        return self._request(
+            "POST", addurl, aditional_headers=aditional_headers, params=params, data=data
+        )
 
 
 class Garmin:
     """Class for fetching data from Garmin Connect."""
 
+    __slots__ = (
+        "username",
+        "password",
+        "cache_ttl",
+        "_cache",
+        "_cookie_jar_path",
+        "_login_lock",
+        "_login_generation",
+        "session",
+        "sso_rest_client",
+        "modern_rest_client",
+        "display_name",
+        "_display_name_quoted",
+        "_daily_summary_url",
+        "_personal_record_url",
+        "_sleep_daily_url",
+        "_rhr_url",
+    )
+
     garmin_connect_base_url = "https://connect.garmin.com"
     garmin_connect_login_url = garmin_connect_base_url + "/en-US/signin"
     garmin_connect_css_url = "https://static.garmincdn.com/com.garmin.connect/ui/css/gauth-custom-v1.2-min.css"
@@ -130,13 +247,54 @@ class Garmin:
     garmin_connect_sleep_daily_url = "proxy/wellness-service/wellness/dailySleepData"
     garmin_connect_rhr = "proxy/userstats-service/wellness/daily"
 
-    garmin_headers = {"NK": "NT"}
+    garmin_headers = MappingProxyType({"NK": "NT"})
 
-    def __init__(self, email, password):
+    # Device registrations and their settings change on the scale of days;
+    # cache them much longer than the per-day statistics.
+    device_cache_ttl = 3600
+
+    def __init__(
+        self, email, password, cache_ttl=20, cookie_jar_path=None, session=None
+    ):
         """Create a new class instance."""
         self.username = email
         self.password = password
-        self.session = cloudscraper.CloudScraper()
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+        self._cookie_jar_path = cookie_jar_path
+        self._login_lock = threading.Lock()
+        self._login_generation = 0
+        if session is None:
+            # Imported here to keep module import light; cloudscraper pulls
+            # in a sizeable dependency tree that is only needed once a
+            # client exists.
+            import cloudscraper
+
+            session = cloudscraper.create_scraper(interpreter="native", delay=0)
+        self.session = session
+        if cookie_jar_path and os.path.isfile(cookie_jar_path):
+            jar = LWPCookieJar(cookie_jar_path)
+            try:
+                jar.load(ignore_discard=True)
+            except (OSError, LoadError):
+                logger.debug("Could not load cookie jar %s", cookie_jar_path)
+            else:
+                for cookie in jar:
+                    self.session.cookies.set_cookie(cookie)
+        # Rebuild whatever adapter the session mounted with our pool and
+        # retry settings, keeping its type and TLS attributes: replacing a
+        # cloudscraper CipherSuiteAdapter with a plain HTTPAdapter would
+        # drop the cipher suite Cloudflare fingerprints during login.
+        mounted = self.session.get_adapter("https://")
+        adapter_kwargs = {
+            "pool_connections": 4,
+            "pool_maxsize": 16,
+            "max_retries": _RETRY,
+        }
+        for attr in ("cipherSuite", "ssl_context", "source_address", "server_hostname"):
+            if hasattr(mounted, attr):
+                adapter_kwargs[attr] = getattr(mounted, attr)
+        self.session.mount("https://", type(mounted)(**adapter_kwargs))
         self.sso_rest_client = ApiClient(
             self.session, "sso.garmin.com/sso", aditional_headers=self.garmin_headers
         )
@@ -147,20 +305,107 @@ class Garmin:
         )
 
         self.display_name = None
+        self._display_name_quoted = None
+        self._daily_summary_url = None
+        self._personal_record_url = None
+        self._sleep_daily_url = None
+        self._rhr_url = None
+
+    def _ensure_login(self):
+        """Log in on first use, coalescing concurrent attempts."""
+
+        if self.display_name is None:
+            with self._login_lock:
+                if self.display_name is None:
+                    if not self.login():
+                        raise GarminConnectAuthenticationError("Login failed")
+                    self._login_generation += 1
+
+    def _relogin(self):
+        """Log in again once, even when several threads see an expired session."""
+
+        generation = self._login_generation
+        with self._login_lock:
+            if generation == self._login_generation:
+                if not self.login():
+                    raise GarminConnectAuthenticationError("Login failed")
+                self._login_generation += 1
+
+    def _api_call(self, url, params=None, ttl=None):
+        """Return parsed JSON for 'url', served from the cache when fresh."""
+
+        self._ensure_login()
+        if ttl is None or not self.cache_ttl:
+            ttl = self.cache_ttl
+        key = (url, tuple(sorted(params.items())) if params else None)
+        if ttl:
+            cached = self._cache.get(key)
+            if cached and monotonic() - cached[0] < ttl:
+                return cached[1]
+        response = _loads(self.modern_rest_client.get(url, params=params).content)
+        if ttl:
+            self._cache[key] = (monotonic(), response)
+        return response
+
+    def invalidate(self):
+        """Drop all cached API responses."""
+
+        self._cache.clear()
 
     @staticmethod
     def __get_json(page_html, key):
-        found = re.search(key + r" = (\{.*\});", page_html, re.M)
-        if found:
-            json_text = found.group(1).replace('\\"', '"')
-            return json.loads(json_text)
-
-        return None
+        start = page_html.find(key + " = {")
+        if start < 0:
+            return None
+        start += len(key) + 3
+
+        # Walk the object with a brace counter instead of a backtracking
+        # regex; track string state so braces inside values don't count.
+        depth = 0
+        in_string = False
+        escaped = False
+        for end in range(start, len(page_html)):
+            char = page_html[end]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    try:
+                        return _loads(page_html[start : end + 1])
+                    except ValueError:
+                        break
+
+        # Escaped variant of the page: every quote is stored as \" so the
+        # string tracker above never closes and the walk misses the end of
+        # the object. Fall back to the baseline extraction -- everything up
+        # to the last "};" on the line -- and unescape before parsing.
+        line_end = page_html.find("\n", start)
+        if line_end < 0:
+            line_end = len(page_html)
+        close = page_html.rfind("};", start, line_end)
+        if close < 0:
+            return None
+        return _loads(page_html[start : close + 1].replace('\\"', '"'))
 
     def login(self):
         """Login to Garmin Connect."""
 
-        logger.debug("login: %s %s", self.username, self.password)
+        logger.debug("login: %s", self.username)
+        self._cache.clear()
+
+        if self._cookie_jar_path and self.session.cookies and self._resume_session():
+            return True
+
         get_headers = {"Referer": self.garmin_connect_login_url}
         params = {
             "service": self.modern_rest_client.url(),
@@ -169,45 +414,25 @@ class Garmin:
             "redirectAfterAccountLoginUrl": self.modern_rest_client.url(),
             "redirectAfterAccountCreationUrl": self.modern_rest_client.url(),
             "gauthHost": self.sso_rest_client.url(),
-            "locale": "en_US",
-            "id": "gauth-widget",
             "cssUrl": self.garmin_connect_css_url,
-            "privacyStatementUrl": "//connect.garmin.com/en-US/privacy/",
-            "clientId": "GarminConnect",
-            "rememberMeShown": "true",
-            "rememberMeChecked": "false",
-            "createAccountShown": "true",
-            "openCreateAccount": "false",
-            "displayNameShown": "false",
-            "consumeServiceTicket": "false",
-            "initialFocus": "true",
-            "embedWidget": "false",
-            "generateExtraServiceTicket": "true",
-            "generateTwoExtraServiceTickets": "false",
-            "generateNoServiceTicket": "false",
-            "globalOptInShown": "true",
-            "globalOptInChecked": "false",
-            "mobile": "false",
-            "connectLegalTerms": "true",
-            "locationPromptShown": "true",
-            "showPassword": "true",
+            **_SSO_LOGIN_PARAMS,
         }
 
         response = self.sso_rest_client.get(
             self.garmin_connect_sso_login, get_headers, params
         )
 
-        found = re.search(r"name=\"_csrf\" value=\"(\w*)", response.text, re.M)
-        if not found:
+        csrf = _scan_csrf(response.content)
+        if csrf is None:
             logger.error("_csrf not found: %s", response.status_code)
             return False
-        logger.debug("_csrf found (%s).", found.group(1))
+        logger.debug("_csrf found (%s).", csrf)
 
         data = {
             "username": self.username,
             "password": self.password,
             "embed": "false",
-            "_csrf": found.group(1),
+            "_csrf": csrf,
         }
         post_headers = {
             "Referer": response.url,
@@ -218,34 +443,86 @@ class Garmin:
             self.garmin_connect_sso_login, post_headers, params, data
         )
 
-        found = re.search(r"\?ticket=([\w-]*)", response.text, re.M)
-        if not found:
+        ticket = _scan_ticket(response.content)
+        if ticket is None:
             logger.error("Login ticket not found (%d).", response.status_code)
             return False
-        params = {"ticket": found.group(1)}
+        params = {"ticket": ticket}
 
         response = self.modern_rest_client.get("", params=params)
 
         user_prefs = self.__get_json(response.text, "VIEWER_USERPREFERENCES")
-        self.display_name = user_prefs["displayName"]
+        self._set_display_name(user_prefs["displayName"])
 
         logger.debug("Display name is %s", self.display_name)
 
+        if self._cookie_jar_path:
+            self._save_cookies()
+
+        return True
+
+    def _resume_session(self):
+        """Try to reuse saved cookies instead of a full SSO handshake."""
+
+        try:
+            response = self.modern_rest_client.get("")
+        except (GarminConnectConnectionError, GarminConnectAuthenticationError):
+            return False
+
+        user_prefs = self.__get_json(response.text, "VIEWER_USERPREFERENCES")
+        if not user_prefs:
+            return False
+
+        self._set_display_name(user_prefs["displayName"])
+        logger.debug("Resumed session for %s", self.display_name)
+
         return True
 
+    def _set_display_name(self, display_name):
+        """Cache the display name and the per-user endpoint URLs."""
+
+        self.display_name = display_name
+        self._display_name_quoted = quote(display_name)
+        self._daily_summary_url = (
+            f"{self.garmin_connect_daily_summary_url}/{self._display_name_quoted}"
+        )
+        self._personal_record_url = (
+            f"{self.garmin_connect_personal_record_url}/{self._display_name_quoted}"
+        )
+        self._sleep_daily_url = (
+            f"{self.garmin_connect_sleep_daily_url}/{self._display_name_quoted}"
+        )
+        self._rhr_url = f"{self.garmin_connect_rhr}/{self._display_name_quoted}"
+
+    def _save_cookies(self):
+        """Persist the session cookies to the configured cookie jar."""
+
+        jar = LWPCookieJar(self._cookie_jar_path)
+        for cookie in self.session.cookies:
+            jar.set_cookie(cookie)
+        try:
+            jar.save(ignore_discard=True)
+        except OSError:
+            logger.debug("Could not save cookie jar %s", self._cookie_jar_path)
+
     def get_user_summary(self, cdate: str) -> Dict[str, Any]:
         """Return user activity summary for 'cdate' format 'YYYY-mm-dd'."""
 
-        url = f"{self.garmin_connect_daily_summary_url}/{self.display_name}"
+        self._ensure_login()
+        url = self._daily_summary_url
         params = {
             "calendarDate": str(cdate),
         }
         logger.debug("Requesting user summary with URL: %s", url)
 
-        response = self.modern_rest_client.get(url, params=params).json()
+        response = self._api_call(url, params=params)
 
         if response["privacyProtected"] is True:
-            raise GarminConnectAuthenticationError("Authentication error")
+            logger.debug("Session expired, trying login again")
+            self._relogin()
+            response = self._api_call(url, params=params)
+            if response["privacyProtected"] is True:
+                raise GarminConnectAuthenticationError("Authentication error")
 
         return response
 
@@ -256,7 +533,7 @@ class Garmin:
         params = {"startDate": str(cdate), "endDate": str(cdate)}
         logger.debug("Requesting body composition with URL: %s", url)
 
-        return self.modern_rest_client.get(url, params=params).json()
+        return self._api_call(url, params=params)
 
     def get_max_metrics(self, cdate: str) -> Dict[str, Any]:
         """Return available max metric data for 'cdate' format 'YYYY-mm-dd'."""
@@ -264,7 +541,7 @@ class Garmin:
         url = f"{self.garmin_connect_metrics_url}/{cdate}"
         logger.debug("Requestng max metrics with URL: %s", url)
 
-        return self.modern_rest_client.get(url).json()
+        return self._api_call(url)
 
     def get_hydration(self, cdate: str) -> Dict[str, Any]:
         """Return available hydration data 'cdate' format 'YYYY-mm-dd'."""
@@ -272,32 +549,55 @@ class Garmin:
         url = f"{self.garmin_connect_daily_hydration_url}/{cdate}"
         logger.debug("Requesting hydration data with URL: %s", url)
 
-        return self.modern_rest_client.get(url).json()
+        return self._api_call(url)
 
     def get_personal_records(self) -> Dict[str, Any]:
         """Return personal records for current user."""
 
-        url = f"{self.garmin_connect_personal_record_url}/{self.display_name}"
+        self._ensure_login()
+        url = self._personal_record_url
         logger.debug("Requesting personal records for user with URL: %s", url)
 
-        return self.modern_rest_client.get(url).json()
+        return self._api_call(url)
 
     def get_sleep_day(self, cdate: str) -> Dict[str, Any]:
         """Return sleep data for current user."""
 
         params = {"date": str(cdate), "nonSleepBufferMinutes": 60}
 
-        url = f"{self.garmin_connect_sleep_daily_url}/{self.display_name}"
+        self._ensure_login()
+        url = self._sleep_daily_url
 
-        return self.modern_rest_client.get(url, params=params).json()
+        return self._api_call(url, params=params)
 
     def get_rhr_day(self, cdate: str) -> Dict[str, Any]:
         """Return resting heartrate data for current user."""
 
         params = {"fromDate": str(cdate), "untilDate": str(cdate), "metricId": 60}
-        url = f"{self.garmin_connect_rhr}/{self.display_name}"
+        self._ensure_login()
+        url = self._rhr_url
 
-        return self.modern_rest_client.get(url, params=params).json()
+        return self._api_call(url, params=params)
+
+    def get_daily(self, cdate: str) -> Dict[str, Any]:
+        """Return the daily statistics for 'cdate' fetched as one batch."""
+
+        logger.debug("Requesting daily data batch for %s", cdate)
+
+        getters = {
+            "summary": self.get_user_summary,
+            "body_composition": self.get_body_composition,
+            "max_metrics": self.get_max_metrics,
+            "hydration": self.get_hydration,
+            "sleep": self.get_sleep_day,
+            "rhr": self.get_rhr_day,
+        }
+        with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+            futures = {
+                name: executor.submit(getter, cdate)
+                for name, getter in getters.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
 
     def get_devices(self) -> Dict[str, Any]:
         """Return available devices for the current user account."""
@@ -305,7 +605,7 @@ class Garmin:
         url = self.garmin_connect_devices_url
         logger.debug("Requesting devices with URL: %s", url)
 
-        return self.modern_rest_client.get(url).json()
+        return self._api_call(url, ttl=self.device_cache_ttl)
 
     def get_device_settings(self, device_id: str) -> Dict[str, Any]:
         """Return device settings for device with 'device_id'."""
@@ -313,28 +613,45 @@ class Garmin:
         url = f"{self.garmin_connect_device_url}/{device_id}"
         logger.debug("Requesting device settings with URL: %s", url)
 
-        return self.modern_rest_client.get(url).json()
+        return self._api_call(url, ttl=self.device_cache_ttl)
 
     def get_device_alarms(self) -> Dict[str, Any]:
         """Get list of active alarms from all devices."""
 
         logger.debug("Requesting device alarms")
 
-        alarms = []
         devices = self.get_devices()
-        for device in devices:
-            device_settings = self.get_device_settings(device["deviceId"])
-            alarms += device_settings["alarms"]
-        return alarms
+        if not devices:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+            settings = executor.map(
+                lambda device: self.get_device_settings(device["deviceId"]), devices
+            )
+            return [alarm for setting in settings for alarm in setting["alarms"]]
 
 
 class GarminConnectConnectionError(Exception):
     """Raised when communication ended in error."""
 
+    __slots__ = ()
+
 
 class GarminConnectTooManyRequestsError(Exception):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ()
+
 
 class GarminConnectAuthenticationError(Exception):
     """Raised when authentication is failed."""
+
+    __slots__ = ()
+
+
+_STATUS_EXCEPTIONS = {
+    429: (GarminConnectTooManyRequestsError, "Too many requests"),
+    401: (GarminConnectAuthenticationError, "Authentication error"),
+    403: (GarminConnectConnectionError, "Forbidden url"),
+    500: (GarminConnectConnectionError, "Server error"),
+    404: (GarminConnectConnectionError, "Not found"),
+}
@@ -18,6 +18,7 @@ setup(
     keywords=["garmin connect", "api", "client"],
     license="MIT license",
     install_requires=["requests", "cloudscraper"],
+    extras_require={"fast": ["orjson>=3.9"]},
     long_description_content_type="text/markdown",
     long_description=readme,
     url="https://github.com/cyberjunky/python-garminconnect-ha",